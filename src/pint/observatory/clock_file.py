@@ -1,7 +1,10 @@
 """Routines for reading and writing various formats of clock file."""
 
+import array
+import io
 import re
 import warnings
+from bisect import bisect_right
 from pathlib import Path
 from textwrap import dedent
 from warnings import warn
@@ -14,7 +17,7 @@ from loguru import logger as log
 from pint.observatory import ClockCorrectionOutOfRange, NoClockCorrections
 from pint.observatory.global_clock_corrections import get_clock_correction_file
 from pint.pulsar_mjd import Time
-from pint.utils import compute_hash, lines_of, open_or_use
+from pint.utils import compute_hash, open_or_use
 
 __all__ = [
     "ClockFile",
@@ -103,15 +106,25 @@ class ClockFile:
         self.valid_beyond_ends = valid_beyond_ends
         if len(mjd) != len(clock):
             raise ValueError(f"MJDs have {len(mjd)} entries but clock has {len(clock)}")
-        self._time = Time(mjd, format="pulsar_mjd", scale="utc")
-        if not np.all(np.diff(self._time.mjd) >= 0):
-            i = np.where(np.diff(self._time.mjd) < 0)[0][0]
+        # Keep the MJDs as a plain array; the Time object is slow to
+        # construct and is only built if someone asks for it
+        self._mjd = np.array(mjd, dtype=np.float64)
+        self._time = None
+        out_of_order = ~(self._mjd[1:] >= self._mjd[:-1])
+        if np.any(out_of_order):
+            i = np.argmax(out_of_order)
             raise ValueError(
-                f"Clock file {self.friendly_name} appears to be out of order: {self._time[i]} > {self._time[i+1]}"
+                f"Clock file {self.friendly_name} appears to be out of order: {self._mjd[i]} > {self._mjd[i+1]}"
             )
-        self._clock = clock.to(u.us)
+        # np.interp copies any input that is not contiguous float64, so keep a
+        # private copy in that layout and let the Quantity share its buffer
+        self._clock_us = np.array(clock.to_value(u.us), dtype=np.float64)
+        self._clock = u.Quantity(self._clock_us, u.us, copy=False)
+        # Plain-list copies for single-time lookups, built on first use
+        self._mjd_list = None
+        self._clock_us_list = None
         if comments is None:
-            self.comments = [""] * len(self._time)
+            self.comments = [""] * len(self._mjd)
         else:
             self.comments = comments
             if len(comments) != len(mjd):
@@ -133,6 +146,14 @@ class ClockFile:
     @property
     def time(self):
         """An astropy.time.Time recording the dates of clock corrections."""
+        if self._time is None:
+            with warnings.catch_warnings():
+                # Some clock files have dubious years in them
+                # Most are removed by automatically ignoring MJD 0, or with "bogus_last_correction"
+                # But Parkes incudes a non-zero correction for MJD 0 so it isn't removed
+                # In any case, the user doesn't need a warning about strange years in clock files
+                warnings.filterwarnings("ignore", r".*dubious year", erfa.ErfaWarning)
+                self._time = Time(self._mjd, format="pulsar_mjd", scale="utc")
         return self._time
 
     @property
@@ -163,16 +184,34 @@ class ClockFile:
         corrections : astropy.units.Quantity
             The corrections in units of microseconds.
         """
-        if not self.valid_beyond_ends and len(self.time) == 0:
+        return u.Quantity(self._evaluate_mjd(t.mjd, limits=limits), u.us)
+
+    def _evaluate_mjd(self, mjd, limits="warn"):
+        """Evaluate the clock corrections, in microseconds, at the MJDs ``mjd``.
+
+        This is :meth:`evaluate` without the Time and Quantity wrapping.
+        """
+        if isinstance(mjd, float) and len(self._mjd) > 0:
+            # Single times are common, and np.interp's per-call array setup
+            # costs far more than the lookup itself; times that are out of
+            # range (or NaN) take the general path below.
+            if self._mjd_list is None:
+                self._mjd_list = self._mjd.tolist()
+                self._clock_us_list = self._clock_us.tolist()
+            mjd = float(mjd)
+            xp = self._mjd_list
+            if xp[0] <= mjd <= xp[-1]:
+                return self._interp_scalar(mjd)
+        if not self.valid_beyond_ends and len(self._mjd) == 0:
             msg = f"No data points in clock file '{self.friendly_name}'"
             if limits == "warn":
                 warn(msg)
-                return np.zeros_like(t) * u.us
+                return np.zeros_like(mjd)
             elif limits == "error":
                 raise NoClockCorrections(msg)
 
         if not self.valid_beyond_ends and (
-            np.any(t < self.time[0]) or np.any(t > self.time[-1])
+            np.any(mjd < self._mjd[0]) or np.any(mjd > self._mjd[-1])
         ):
             msg = f"Data points out of range in clock file '{self.friendly_name}'"
             if limits == "warn":
@@ -180,12 +219,54 @@ class ClockFile:
             elif limits == "error":
                 raise ClockCorrectionOutOfRange(msg)
 
-        # Can't pass Times directly to np.interp.  This should be OK:
-        return np.interp(t.mjd, self.time.mjd, self.clock.to(u.us).value) * u.us
+        # np.interp starts each search next to the previous result, so
+        # sorted times (the usual case) don't need a full bisection each.
+        return np.interp(mjd, self._mjd, self._clock_us)
+
+    def _interp_scalar(self, mjd):
+        """Interpolate at one MJD within the file, exactly as np.interp would.
+
+        At a repeated MJD this takes the value from the last copy, which is
+        what np.interp does.
+        """
+        xp = self._mjd_list
+        fp = self._clock_us_list
+        i = bisect_right(xp, mjd) - 1
+        if mjd == xp[i]:
+            return fp[i]
+        slope = (fp[i + 1] - fp[i]) / (xp[i + 1] - xp[i])
+        return slope * (mjd - xp[i]) + fp[i]
+
+    def _evaluate_for_merge(self, mjds):
+        """Evaluate the clock corrections, in microseconds, at merged MJDs.
+
+        The MJDs ``mjds`` must be sorted and contain each discontinuity of
+        this clock twice; the two copies get the values from either side
+        of the jump.
+        """
+        # Interpolate everywhere
+        corr = self._evaluate_mjd(mjds)
+        # Find locations of left sides of discontinuities
+        z = np.diff(self._mjd) == 0
+        # Looking for the left end of a run of equal values
+        zl = z.copy()
+        zl[1:] &= ~z[:-1]
+        ixl = np.where(zl)[0]
+        # Fix discontinuities
+        corr[np.searchsorted(mjds, self._mjd[ixl], side="left")] = self._clock_us[ixl]
+
+        zr = z.copy()
+        zr[:-1] &= ~z[1:]
+        ixr = np.where(zr)[0]
+        # Fix discontinuities
+        corr[np.searchsorted(mjds, self._mjd[ixr], side="right") - 1] = self._clock_us[
+            ixr + 1
+        ]
+        return corr
 
     def last_correction_mjd(self):
         """Last MJD for which corrections are available."""
-        return -np.inf if len(self.time) == 0 else self.time[-1].mjd
+        return -np.inf if len(self._mjd) == 0 else self._mjd[-1]
 
     @staticmethod
     def merge(clocks, *, trim=True):
@@ -211,59 +292,36 @@ class ClockFile:
         ClockFile
             A merged ClockFile object.
         """
-        all_mjds = []
-        all_discontinuities = set()
-        for c in clocks:
-            mjds = c._time.mjd
-            all_mjds.append(mjds)
-            all_discontinuities.update(mjds[:-1][np.diff(mjds) == 0])
-        mjds = np.unique(np.concatenate(all_mjds))
-        r = np.ones(len(mjds), dtype=int)
-        for m in all_discontinuities:
-            i = np.searchsorted(mjds, m)
-            r[i] = 2
+        mjds = np.unique(np.concatenate([c._mjd for c in clocks]))
+        # Any MJD repeated in any clock is a discontinuity and appears twice
+        all_discontinuities = np.concatenate(
+            [c._mjd[:-1][np.diff(c._mjd) == 0] for c in clocks]
+        )
+        r = np.ones(len(mjds), dtype=np.int8)
+        r[np.searchsorted(mjds, all_discontinuities)] = 2
         mjds = np.repeat(mjds, r)
 
-        times = Time(mjds, format="pulsar_mjd", scale="utc")
-        corr = np.zeros(len(mjds)) * u.s
+        # Each clock's contribution is independent; accumulate them in
+        # microseconds as plain floats and put the units on at the end
+        corr = np.zeros(len(mjds))
         for c in clocks:
-            # Interpolate everywhere
-            this_corr = c.evaluate(times)
-            # Find locations of left sides of discontinuities
-            z = np.diff(c._time.mjd) == 0
-            # Looking for the left end of a run of equal values
-            zl = z.copy()
-            zl[1:] &= ~z[:-1]
-            ixl = np.where(zl)[0]
-            # Fix discontinuities
-            this_corr[np.searchsorted(mjds, c._time.mjd[ixl], side="left")] = c._clock[
-                ixl
-            ]
-
-            zr = z.copy()
-            zr[:-1] &= ~z[1:]
-            ixr = np.where(zr)[0]
-            # Fix discontinuities
-            this_corr[np.searchsorted(mjds, c._time.mjd[ixr], side="right")] = c._clock[
-                ixr + 1
-            ]
-            corr += this_corr
+            corr += c._evaluate_for_merge(mjds)
         if trim:
-            b = max(c._time.mjd[0] for c in clocks)
-            e = min(c._time.mjd[-1] for c in clocks)
-            il = np.searchsorted(times.mjd, b)
-            ir = np.searchsorted(times.mjd, e, side="right")
-            times = times[il:ir]
+            b = max(c._mjd[0] for c in clocks)
+            e = min(c._mjd[-1] for c in clocks)
+            il = np.searchsorted(mjds, b)
+            ir = np.searchsorted(mjds, e, side="right")
+            mjds = mjds[il:ir]
             corr = corr[il:ir]
 
         comments = []
         indices = [0] * len(clocks)
-        for m in times.mjd:
+        for m in mjds:
             com = ""
             for i, c in enumerate(clocks):
-                while indices[i] < len(c._time) and c._time.mjd[indices[i]] < m:
+                while indices[i] < len(c._mjd) and c._mjd[indices[i]] < m:
                     indices[i] += 1
-                if indices[i] < len(c._time) and c._time.mjd[indices[i]] == m:
+                if indices[i] < len(c._mjd) and c._mjd[indices[i]] == m:
                     if com == "":
                         com = c.comments[indices[i]]
                     elif c.comments[indices[i]] != "":
@@ -281,8 +339,8 @@ class ClockFile:
                     leading_comment += "\n" + c.leading_comment
 
         return ClockFile(
-            mjd=times.mjd,
-            clock=corr,
+            mjd=mjds,
+            clock=corr * u.us,
             comments=comments,
             leading_comment=leading_comment,
             friendly_name=f"Merged from {[c.filename for c in clocks]}",
@@ -313,9 +371,14 @@ class ClockFile:
             raise ValueError(
                 "Invalid TEMPO obscode {obscode!r}, should be one printable character"
             )
-        mjds = self.time.mjd
+        mjds = self._mjd
         corr = self.clock.to_value(u.us)
         comments = self.comments or [""] * len(self.clock)
+        # FIXME: always use C locale
+        # The date column only needs the calendar day, so skip astropy
+        # (MJD 0 is 1858 November 17)
+        days = np.datetime64("1858-11-17") + np.floor(mjds).astype(np.int64)
+        dates = [d.strftime("%d-%b-%y") for d in days.astype(object)]
         # TEMPO writes microseconds
         if extra_comment is None:
             leading_comment = self.leading_comment
@@ -329,24 +392,26 @@ class ClockFile:
                 f.write(leading_comment.strip())
                 f.write("\n")
             # Do not use EECO-REF column as TEMPO does a weird subtraction thing
-            # sourcery skip: hoist-statement-from-loop
-            for mjd, corr, comment in zip(mjds, corr, comments):
+            eeco = 0.0
+            # Format everything first and write it in one go
+            lines = []
+            for mjd, corr, comment, date in zip(
+                mjds.tolist(), corr.tolist(), comments, dates
+            ):
                 # 0:9 for MJD
                 # 9:21 for clkcorr1 (do not use)
                 # 21:33 for clkcorr2
                 # 34 for obscode
                 # Extra stuff ignored
-                # FIXME: always use C locale
-                date = Time(mjd, format="pulsar_mjd").datetime.strftime("%d-%b-%y")
-                eeco = 0.0
-                f.write(f"{mjd:9.2f}{eeco:12.3f}{corr:12.3f} {obscode}    {date}")
+                line = f"{mjd:9.2f}{eeco:12.3f}{corr:12.3f} {obscode}    {date}"
                 if comment:
                     # Try to avoid trailing whitespace
                     if comment.startswith("\n"):
-                        f.write(f"{comment}".rstrip())
+                        line += comment.rstrip()
                     else:
-                        f.write(f"  {comment}".rstrip())
-                f.write("\n")
+                        line += f"  {comment}".rstrip()
+                lines.append(line + "\n")
+            f.write("".join(lines))
 
     def write_tempo2_clock_file(self, filename, hdrline=None, extra_comment=None):
         """Write clock corrections as a TEMPO2-format clock correction file.
@@ -392,17 +457,20 @@ class ClockFile:
             if leading_comment is not None:
                 f.write(leading_comment.rstrip())
                 f.write("\n")
-            comments = self.comments or [""] * len(self.time)
+            comments = self.comments or [""] * len(self._mjd)
 
+            # Format everything first and write it in one go
+            lines = []
             for mjd, corr, comment in zip(
-                self.time.mjd, self.clock.to_value(u.s), comments
+                self._mjd.tolist(), self.clock.to_value(u.s).tolist(), comments
             ):
-                f.write(f"{mjd:.5f} {corr:.12f}")
+                line = f"{mjd:.5f} {corr:.12f}"
                 if comment:
                     if not comment.startswith("\n"):
-                        f.write(" ")
-                    f.write(comment.rstrip())
-                f.write("\n")
+                        line += " "
+                    line += comment.rstrip()
+                lines.append(line + "\n")
+            f.write("".join(lines))
 
     def export(self, filename):
         """Write this clock correction file to the specified location."""
@@ -412,7 +480,7 @@ class ClockFile:
         try:
             contents = Path(self.filename).read_text()
         except IOError:
-            if len(self.time) > 0:
+            if len(self._mjd) > 0:
                 log.info(f"Unable to load original clock file for {self}")
                 # FIXME: use write? Do we know what format we should be in?
             return
@@ -420,7 +488,7 @@ class ClockFile:
             f.write(contents)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.friendly_name=}, {len(self.time)=})"
+        return f"{self.__class__.__name__}({self.friendly_name=}, len(self.time)={len(self._mjd)})"
 
 
 # TEMPO2
@@ -432,6 +500,14 @@ clkcorr_re = re.compile(
     r"\s+([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eEdD][-+]?\d+)?)"
     r" ?(.*)"
 )
+# The same for a whole file at once: each line matches either as a clock
+# correction (groups 1-3) or, failing that, as a comment (group 4)
+clkcorr_lines_re = re.compile(
+    r"^[^\S\n]*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eEdD][-+]?\d+)?)"
+    r"[^\S\n]+([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eEdD][-+]?\d+)?)"
+    r" ?(.*)|^(.*)",
+    flags=re.MULTILINE,
+)
 
 
 def read_tempo2_clock_file(
@@ -478,38 +554,74 @@ def read_tempo2_clock_file(
                 leading_comment += "\n" + s.rstrip()
 
         with open_or_use(filename) as f:
-            hdrline = None
-            for line in f:
-                if hdrline is None:
-                    hdrline = line
-                    m = hdrline_re.match(hdrline)
-                    if not m:
-                        raise ValueError(
-                            f"Header line must start with # and contain two time scales: {hdrline!r}"
-                        )
-                    header = hdrline
-                    # FIXME: explicit support of from/to timescales and badness?
-                    timescale_from = m.group(1)
-                    timescale_to = m.group(2)
-                    badness = 1 if m.group(3) is None else int(m.group(3))
-                    # Extra stuff on the hdrline <shrug />
-                    hdrline_extra = "" if m.group(4) is None else m.group(4)
-                    continue
-                if line.startswith("#"):
-                    add_comment(line)
-                    continue
-                m = clkcorr_re.match(line)
-                if m is None:
+            contents = f.read()
+        # Only "\n" ends a line, as when iterating over the file;
+        # str.splitlines would also split on form feeds and the like
+        lines = list(io.StringIO(contents))
+        hdrline = lines[0] if lines else ""
+        m = hdrline_re.match(hdrline)
+        if not m:
+            raise ValueError(
+                f"Header line must start with # and contain two time scales: {hdrline!r}"
+            )
+        header = hdrline
+        # FIXME: explicit support of from/to timescales and badness?
+        timescale_from = m.group(1)
+        timescale_to = m.group(2)
+        badness = 1 if m.group(3) is None else int(m.group(3))
+        # Extra stuff on the hdrline <shrug />
+        hdrline_extra = "" if m.group(4) is None else m.group(4)
+        body = lines[1:]
+
+        # Fast path: let numpy parse the numbers, and only look at
+        # individual lines to pick up the comments. Files that need the
+        # fallback pay for the failed attempt too (up to a whole loadtxt run
+        # if the odd line is near the end); finding them beforehand would
+        # cost every regular file about as much.
+        is_data = [bool(line.split("#", 1)[0].strip()) for line in body]
+        try:
+            if any(is_data):
+                mjd, clk = np.loadtxt(
+                    body, comments="#", usecols=(0, 1), unpack=True, ndmin=2
+                )
+            else:
+                mjd, clk = np.zeros(0), np.zeros(0)
+            if len(mjd) != sum(is_data) or not (
+                np.all(np.isfinite(mjd)) and np.all(np.isfinite(clk))
+            ):
+                raise ValueError("Not a simple TEMPO2-format clock file")
+        except ValueError:
+            # Something unusual (for example lines that start with a number
+            # but not two); fall back to emulating sscanf
+            mjd = array.array("d")
+            clk = array.array("d")
+            body_text = contents[len(hdrline) :]
+            if body_text.endswith("\n"):
+                # Otherwise there's an extra empty "line" at the end
+                body_text = body_text[:-1]
+            for m in clkcorr_lines_re.finditer(body_text):
+                if m.group(4) is not None:
                     # Anything that doesn't match is a comment, what fun!
                     # This is what T2 does, using sscanf
-                    add_comment(line)
+                    add_comment(m.group(4))
                     continue
                 mjd.append(float(m.group(1)))
                 clk.append(float(m.group(2)))
                 comments.append(None)
-                if m.group(3) is not None:
+                # Anything else on the line is a comment too
+                add_comment(m.group(3))
+        else:
+            for line, d in zip(body, is_data):
+                if not d:
+                    add_comment(line)
+                    continue
+                comments.append(None)
+                if "#" in line or len(line.split(None, 2)) > 2:
                     # Anything else on the line is a comment too
-                    add_comment(m.group(3))
+                    add_comment(clkcorr_re.match(line).group(3))
+                else:
+                    add_comment("")
+        mjd = np.array(mjd)
         clk = np.array(clk)
     except OSError:
         raise NoClockCorrections(
@@ -519,27 +631,21 @@ def read_tempo2_clock_file(
         mjd = mjd[:-1]
         clk = clk[:-1]
         comments = comments[:-1]
-    while len(mjd) and mjd[0] == 0:
-        # Zap leading zeros
-        mjd = mjd[1:]
-        clk = clk[1:]
-        comments = comments[1:]
-    with warnings.catch_warnings():
-        # Some clock files have dubious years in them
-        # Most are removed by automatically ignoring MJD 0, or with "bogus_last_correction"
-        # But Parkes incudes a non-zero correction for MJD 0 so it isn't removed
-        # In any case, the user doesn't need a warning about strange years in clock files
-        warnings.filterwarnings("ignore", r".*dubious year", erfa.ErfaWarning)
-        return ClockFile(
-            mjd,
-            clk * u.s,
-            filename=filename,
-            comments=comments,
-            leading_comment=leading_comment,
-            header=header,
-            friendly_name=friendly_name,
-            valid_beyond_ends=valid_beyond_ends,
-        )
+    # Zap leading zeros
+    n = np.argmax(mjd != 0) if np.any(mjd != 0) else len(mjd)
+    mjd = mjd[n:]
+    clk = clk[n:]
+    comments = comments[n:]
+    return ClockFile(
+        mjd,
+        clk * u.s,
+        filename=filename,
+        comments=comments,
+        leading_comment=leading_comment,
+        header=header,
+        friendly_name=friendly_name,
+        valid_beyond_ends=valid_beyond_ends,
+    )
 
 
 ClockFile._formats["tempo2"] = read_tempo2_clock_file
@@ -559,6 +665,34 @@ tempo_standard_header_res = [
 ]
 
 
+def _parse_fixed_width_floats(chars, start, stop):
+    """Parse the floats in columns ``start:stop`` of a 2D array of characters.
+
+    Returns an array of values and a boolean array indicating which
+    values could be parsed; values that could not be parsed are zero.
+    """
+    fields = np.ascontiguousarray(chars[:, start:stop]).view(f"U{stop-start}")[:, 0]
+    ok = np.char.strip(fields) != ""
+    # Python's float() is what TEMPO-format files have always been read
+    # with, and it is faster than numpy's own string conversion
+    try:
+        values = np.fromiter(
+            map(float, np.where(ok, fields, "0").tolist()), np.float64, len(fields)
+        )
+        return values, ok
+    except ValueError:
+        pass
+    # Something that isn't a number; sort it out one field at a time
+    values = np.zeros(len(fields))
+    for i, f in enumerate(fields.tolist()):
+        if ok[i]:
+            try:
+                values[i] = float(f)
+            except ValueError:
+                ok[i] = False
+    return values, ok
+
+
 def read_tempo_clock_file(
     filename,
     obscode=None,
@@ -614,10 +748,7 @@ def read_tempo_clock_file(
             f"Loading TEMPO-format observatory ({obscode}) clock correction file {friendly_name} ({filename}) with {bogus_last_correction=}"
         )
 
-    mjds = []
-    clkcorrs = []
     comments = []
-    seen_obscodes = set()
 
     def add_comment(s):
         nonlocal leading_comment
@@ -644,108 +775,139 @@ def read_tempo_clock_file(
         # (The deviation would be that in gaps you get an interpolated value
         # rather than an error message.)
 
-        for l in lines_of(filename):
-            # Ignore comment lines
-            if l.startswith("#"):
-                add_comment(l)
-                continue
-
-            # FIXME: the header *could* contain to and from timescale information
-            # TEMPO has very, ah, flexible notions of what is an acceptable file
-            # https://sourceforge.net/p/tempo/tempo/ci/master/tree/src/newsrc.f#l272
-            # Any line that starts with "MJD" or "=====" is assumed to be
-            # part of the header.  TEMPO describes this as a
-            # "commonly used header format".
-            ls = l.split()
-            if ls and ls[0].upper().startswith("MJD"):
-                # Header line. Do we preserve it?
-                continue
-            if ls and ls[0].startswith("====="):
+        with open_or_use(filename) as f:
+            lines = list(f)
+        # Fixed-width view of the data columns (0-33) and the site code (34)
+        # of every line; shorter lines are padded with nulls, which numpy
+        # reads back as empty strings
+        text = np.array(lines, dtype="U35")
+        chars = text.view("U1").reshape(-1, 35)
+        is_comment = chars[:, 0] == "#"
+
+        # FIXME: the header *could* contain to and from timescale information
+        # TEMPO has very, ah, flexible notions of what is an acceptable file
+        # https://sourceforge.net/p/tempo/tempo/ci/master/tree/src/newsrc.f#l272
+        # Any line that starts with "MJD" or "=====" is assumed to be
+        # part of the header.  TEMPO describes this as a
+        # "commonly used header format".
+        # Lines that start with a number can't be headers or INCLUDEs, so
+        # only the others need looking at one by one.
+        first = np.char.lstrip(text).astype("U1")
+        is_header = np.zeros(len(lines), dtype=bool)
+        includes = []
+        for i in np.flatnonzero(~is_comment & ~np.isin(first, list("0123456789+-."))):
+            ls = lines[i].split()
+            if ls and (ls[0].upper().startswith("MJD") or ls[0].startswith("=====")):
                 # Header line. Do we preserve it?
+                is_header[i] = True
+            elif ls and ls[0].upper() == "INCLUDE" and process_includes:
+                includes.append(i)
+        data_lines = np.flatnonzero(~is_comment & ~is_header)
+        data_chars = chars[data_lines]
+
+        # Site code on clock file line must match
+        # FIXME: f flag(?) in l[36]?
+        codes, code_ix = np.unique(data_chars[:, 34], return_inverse=True)
+        csites = [c.lower() if c else None for c in codes]
+        last_line = len(lines)
+        seen_obscodes = None
+        if obscode is not None:
+            keep = np.isin(
+                code_ix, [j for j, c in enumerate(csites) if c == obscode.lower()]
+            )
+        else:
+            keep = np.ones(len(data_lines), dtype=bool)
+            if len({c for c in csites if c is not None}) > 1:
+                # Reading stops at the first line with a second site code
+                line_csites = np.array(csites, dtype=object)[code_ix]
+                known = np.isin(code_ix, [j for j, c in enumerate(csites) if c])
+                first_csite = line_csites[np.argmax(known)]
+                k = np.argmax(known & (line_csites != first_csite))
+                seen_obscodes = {first_csite, line_csites[k]}
+                last_line = data_lines[k]
+
+        mjd_col, mjd_ok = _parse_fixed_width_floats(data_chars, 0, 9)
+        clkcorr1, clkcorr1_ok = _parse_fixed_width_floats(data_chars, 9, 21)
+        clkcorr2, clkcorr2_ok = _parse_fixed_width_floats(data_chars, 21, 33)
+        # allow mjd=0 to pass, since that is often used
+        # for effectively null clock files
+        suspicious = mjd_ok & (
+            ((mjd_col < 39000) & (mjd_col != 0)) | (mjd_col > 100000)
+        )
+        for mjd in mjd_col[suspicious & (data_lines <= last_line)]:
+            log.info(f"Disregarding suspicious MJD {mjd} in TEMPO clock file")
+        mjd_ok &= ~suspicious
+        # Need MJD and at least one of the two clkcorrs;
+        # if one of the clkcorrs is missing, it defaults to zero
+        usable = mjd_ok & (clkcorr1_ok | clkcorr2_ok)
+        # This adjustment is hard-coded in tempo:
+        clkcorr1[clkcorr1 > 800.0] -= 818.8
+
+        rows = keep & usable
+        row_lines = data_lines[rows]
+        row_mjds = mjd_col[rows]
+        row_clkcorrs = (clkcorr2 - clkcorr1)[rows]
+        # Anything past column 50 is a comment on that row
+        row_comments = [lines[i][50:].rstrip() for i in row_lines.tolist()]
+
+        # Only comment lines and INCLUDEs need handling in order; unusable
+        # lines become comments too
+        comment_lines = np.concatenate(
+            [np.flatnonzero(is_comment), data_lines[keep & ~usable]]
+        )
+        # An INCLUDE line that is not itself usable becomes a comment after
+        # the included corrections
+        events = sorted(
+            [(i, False) for i in includes] + [(i, True) for i in comment_lines.tolist()]
+        )
+        mjds = []
+        clkcorrs = []
+        done = 0
+        for i, is_comment_line in events:
+            if i > last_line:
+                break
+            n = np.searchsorted(row_lines, i)
+            mjds.append(row_mjds[done:n])
+            clkcorrs.append(row_clkcorrs[done:n])
+            comments.extend(row_comments[done:n])
+            done = n
+            if is_comment_line:
+                add_comment(lines[i])
                 continue
 
             # Process INCLUDE
             # Assumes included file is in same dir as this one
-            ls = l.split()
-            if ls and ls[0].upper() == "INCLUDE" and process_includes:
-                # Find the new file, if possible
-                if isinstance(filename, str):
-                    fn = Path(filename)
-                elif isinstance(filename, Path):
-                    fn = filename
-                else:
-                    raise ValueError(
-                        f"Don't know how to process INCLUDE statement in {filename}"
-                    )
-                # Construct a TEMPO-format clock file object
-                ifn = fn.parent / ls[1]
-                ic = read_tempo_clock_file(ifn, obscode=obscode)
-                # Splice in that object, handling leading and in-line comments
-                if leading_comment is None:
-                    if ic.leading_comment is not None:
-                        leading_comment = ic.leading_comment
-                else:
-                    leading_comment += "\n" + ic.leading_comment
-                mjds.extend(ic._time.mjds)
-                clkcorrs.extend(ic._clock)
-                comments.extend(ic.comments)
-
-            # Parse MJD
-            try:
-                mjd = float(l[:9])
-                # allow mjd=0 to pass, since that is often used
-                # for effectively null clock files
-                if (mjd < 39000 and mjd != 0) or mjd > 100000:
-                    log.info(f"Disregarding suspicious MJD {mjd} in TEMPO clock file")
-                    mjd = None
-            except (ValueError, IndexError):
-                mjd = None
-            # Parse two clkcorr values
-            try:
-                clkcorr1 = float(l[9:21])
-            except (ValueError, IndexError):
-                clkcorr1 = None
-            try:
-                clkcorr2 = float(l[21:33])
-            except (ValueError, IndexError):
-                clkcorr2 = None
-
-            # Site code on clock file line must match
-            try:
-                csite = l[34].lower()
-            except IndexError:
-                csite = None
-            if (obscode is not None) and (obscode.lower() != csite):
-                continue
-            # FIXME: f flag(?) in l[36]?
-            if csite is not None:
-                seen_obscodes.add(csite)
-                if len(seen_obscodes) > 1:
-                    raise ValueError(
-                        f"TEMPO-format file {filename} contains multiple "
-                        f"observatory codes: {seen_obscodes}"
-                    )
-
-            # Need MJD and at least one of the two clkcorrs
-            if mjd is None:
-                add_comment(l)
-                continue
-            if (clkcorr1 is None) and (clkcorr2 is None):
-                add_comment(l)
-                continue
-            # If one of the clkcorrs is missing, it defaults to zero
-            if clkcorr1 is None:
-                clkcorr1 = 0.0
-            if clkcorr2 is None:
-                clkcorr2 = 0.0
-            # This adjustment is hard-coded in tempo:
-            if clkcorr1 > 800.0:
-                clkcorr1 -= 818.8
-            # Add the value to the list
-            mjds.append(mjd)
-            clkcorrs.append(clkcorr2 - clkcorr1)
-            comments.append(None)
-            add_comment(l[50:])
+            # Find the new file, if possible
+            if isinstance(filename, str):
+                fn = Path(filename)
+            elif isinstance(filename, Path):
+                fn = filename
+            else:
+                raise ValueError(
+                    f"Don't know how to process INCLUDE statement in {filename}"
+                )
+            # Construct a TEMPO-format clock file object
+            ifn = fn.parent / lines[i].split()[1]
+            ic = read_tempo_clock_file(ifn, obscode=obscode)
+            # Splice in that object, handling leading and in-line comments
+            if leading_comment is None:
+                if ic.leading_comment is not None:
+                    leading_comment = ic.leading_comment
+            else:
+                leading_comment += "\n" + ic.leading_comment
+            mjds.append(ic._mjd)
+            clkcorrs.append(ic._clock_us)
+            comments.extend(ic.comments)
+        if seen_obscodes is not None:
+            raise ValueError(
+                f"TEMPO-format file {filename} contains multiple "
+                f"observatory codes: {seen_obscodes}"
+            )
+        mjds.append(row_mjds[done:])
+        clkcorrs.append(row_clkcorrs[done:])
+        comments.extend(row_comments[done:])
+        mjds = np.concatenate(mjds)
+        clkcorrs = np.concatenate(clkcorrs)
     except OSError:
         raise NoClockCorrections(
             f"TEMPO-style clock correction file {filename} "
@@ -755,11 +917,11 @@ def read_tempo_clock_file(
         mjds = mjds[:-1]
         clkcorrs = clkcorrs[:-1]
         comments = comments[:-1]
-    while len(mjds) and mjds[0] == 0:
-        # Zap leading zeros
-        mjds = mjds[1:]
-        clkcorrs = clkcorrs[1:]
-        comments = comments[1:]
+    # Zap leading zeros
+    n = np.argmax(mjds != 0) if np.any(mjds != 0) else len(mjds)
+    mjds = mjds[n:]
+    clkcorrs = clkcorrs[n:]
+    comments = comments[n:]
     return ClockFile(
         mjds,
         clkcorrs * u.us,
@@ -849,6 +1011,11 @@ class GlobalClockFile(ClockFile):
                 )
                 self.clock_file.friendly_name = self.friendly_name
 
+    def _evaluate_mjd(self, mjd, limits="warn"):
+        if np.any(mjd > self.clock_file._mjd[-1]):
+            self.update()
+        return self.clock_file._evaluate_mjd(mjd, limits=limits)
+
     def evaluate(self, t, limits="warn"):
         """Evaluate the clock corrections at the times t.
 
@@ -873,7 +1040,7 @@ class GlobalClockFile(ClockFile):
         corrections : astropy.units.Quantity
             The corrections in units of microseconds.
         """
-        needs_update = np.any(t > self.clock_file.time[-1])
+        needs_update = np.any(t.mjd > self.clock_file._mjd[-1])
         if needs_update:
             self.update()
         return self.clock_file.evaluate(t, limits=limits)
@@ -890,6 +1057,14 @@ class GlobalClockFile(ClockFile):
     def time(self):
         return self.clock_file.time
 
+    @property
+    def _mjd(self):
+        return self.clock_file._mjd
+
+    @property
+    def _clock_us(self):
+        return self.clock_file._clock_us
+
     @property
     def clock(self):
         return self.clock_file.clock
@@ -100,6 +100,21 @@ def test_merge_clocks_preserves_discontinuities():
     assert m.evaluate(t(55001)) == m.evaluate(t(60000))
 
 
+def test_merge_clocks_discontinuity_values():
+    a = np.array([50000, 60000])
+    av = np.array([0, 0]) * u.us
+    b = np.array([50000, 55000, 55000, 60000])
+    bv = np.array([0, 0, 1, 5]) * u.us
+
+    ca = ClockFile(mjd=a, clock=av)
+    cb = ClockFile(mjd=b, clock=bv)
+
+    m = ClockFile.merge([ca, cb])
+
+    assert_array_equal(m.time.mjd, b)
+    assert_array_equal(m.clock.to_value(u.us), bv.to_value(u.us))
+
+
 def test_merge_mjds_trims_range():
     a = np.array([50000, 60000])
     b = np.array([40000, 55000, 61000])
@@ -177,6 +192,52 @@ def test_tempo_round_trip_file(basic_clock, tmp_path):
     assert_allclose(read_clock.clock.to_value(u.us), basic_clock.clock.to_value(u.us))
 
 
+def test_tempo_include(tmp_path):
+    (tmp_path / "main.dat").write_text(
+        dedent(
+            """\
+               MJD       EECO-REF    NIST-REF NS      DATE    COMMENTS
+            =========    ========    ======== ==    ========  ========
+             50000.00       0.000       1.000 a    10-Oct-95
+            INCLUDE other.dat
+             50003.00       0.000       4.000 a    13-Oct-95
+            """
+        )
+    )
+    (tmp_path / "other.dat").write_text(
+        " 50001.00       0.000       2.000 a    11-Oct-95\n"
+        " 50002.00       0.000       3.000 a    12-Oct-95\n"
+    )
+    c = ClockFile.read(str(tmp_path / "main.dat"), format="tempo", obscode="a")
+    assert_array_equal(c.time.mjd, [50000, 50001, 50002, 50003])
+    assert_array_equal(c.clock.to_value(u.us), [1, 2, 3, 4])
+
+
+def test_tempo_site_codes():
+    contents = dedent(
+        """\
+           MJD       EECO-REF    NIST-REF NS      DATE    COMMENTS
+        =========    ========    ======== ==    ========  ========
+        # leading
+         50000.00       0.000       1.000 a    10-Oct-95  first
+         50001.00       0.000       9.000 b    11-Oct-95  other site
+        # after first
+         50002.00     819.800       2.000 a    12-Oct-95
+         garbage                    3.000 a
+        """
+    )
+    c = ClockFile.read(StringIO(contents), format="tempo", obscode="a")
+    assert_array_equal(c.time.mjd, [50000, 50002])
+    assert_allclose(c.clock.to_value(u.us), [1, 1])
+    assert c.leading_comment == "# leading"
+    assert c.comments == [
+        "first\n# after first",
+        "\n garbage                    3.000 a",
+    ]
+    with pytest.raises(ValueError, match="multiple observatory codes"):
+        ClockFile.read(StringIO(contents), format="tempo")
+
+
 loadable_observatories = ["gbt", "arecibo", "fast", "gb140", "gb853", "jb", "wsrt"]
 
 
@@ -237,6 +298,13 @@ def test_tempo_round_trip(basic_clock):
     )
 
 
+def test_tempo_write_near_leap_second():
+    c = ClockFile(mjd=np.array([57203.5, 57203.99999]), clock=np.zeros(2) * u.us)
+    f = StringIO()
+    c.write_tempo_clock_file(f, obscode="1")
+    assert f.getvalue().splitlines()[-1].endswith("30-Jun-15")
+
+
 def test_tempo_round_trip_arecibo():
     ao = get_observatory("arecibo")
     ao.last_clock_correction_mjd()
@@ -271,6 +339,66 @@ def test_tempo2_round_trip_comments():
     assert o.getvalue() == contents
 
 
+def test_tempo2_irregular_lines_are_comments():
+    contents = dedent(
+        """\
+        # FAKE1 FAKE2
+        50000.00000 0.000001000000 And some text
+        50000.5
+          # An indented commenty line
+        50001.00000 0.000002000000# tight comment
+        """
+    )
+    c = ClockFile.read(StringIO(contents), format="tempo2")
+    assert_array_equal(c.time.mjd, [50000, 50001])
+    assert_allclose(c.clock.to_value(u.us), [1, 2])
+    assert c.comments == [
+        "And some text\n50000.5\n  # An indented commenty line",
+        "# tight comment",
+    ]
+
+
+def test_tempo2_regular_comments_match_fallback(monkeypatch):
+    contents = dedent(
+        """\
+        # FAKE1 FAKE2
+        # A leading comment
+        50000.00000 0.000001000000 And some text
+          # An indented commenty line
+        50001.00000 0.000002000000# tight comment
+        50002.00000 0.000003000000
+        50003.00000 0.000004000000 text # and more
+        # trailing
+        """
+    )
+    fast = ClockFile.read(StringIO(contents), format="tempo2")
+    assert fast.leading_comment == "# A leading comment"
+    assert fast.comments == [
+        "And some text\n  # An indented commenty line",
+        "# tight comment",
+        "",
+        "text # and more\n# trailing",
+    ]
+
+    def no_loadtxt(*args, **kwargs):
+        raise ValueError("forcing the line-by-line parser")
+
+    monkeypatch.setattr(np, "loadtxt", no_loadtxt)
+    slow = ClockFile.read(StringIO(contents), format="tempo2")
+    assert_array_equal(fast.time.mjd, slow.time.mjd)
+    assert_array_equal(fast.clock, slow.clock)
+    assert fast.leading_comment == slow.leading_comment
+    assert fast.comments == slow.comments
+
+
+@pytest.mark.parametrize("extra", ["", "50000.5\n"])
+def test_tempo2_only_newline_ends_lines(extra):
+    contents = "# FAKE1 FAKE2\n50000 0.000001\x0c50001 0.000002\n" + extra
+    c = ClockFile.read(StringIO(contents), format="tempo2")
+    assert_array_equal(c.time.mjd, [50000])
+    assert c.comments[0].startswith("\x0c50001")
+
+
 def test_tempo_round_trip_comments():
     contents = dedent(
         """\
@@ -483,3 +611,16 @@ def test_out_of_order_raises_exception():
             friendly_name="basic_clock",
         )
     assert "55000" in str(excinfo.value)
+
+
+def test_scalar_evaluate_matches_interp():
+    mjd = np.array([50000, 50000.5, 55000, 55000, 55000, 57000.25, 60000])
+    clock = np.array([1.0, 3.0, 2.0, -4.0, 7.0, 0.1, -1.0])
+    c = ClockFile(mjd=mjd, clock=clock * u.us)
+
+    rng = np.random.default_rng(0)
+    xs = np.concatenate([mjd, (mjd[1:] + mjd[:-1]) / 2, rng.uniform(50000, 60000, 100)])
+    for x in xs:
+        r = c.evaluate(t(x), limits="error")
+        assert r.isscalar
+        assert r.to_value(u.us) == np.interp(t(x).mjd, mjd, clock)